@@ -11,25 +11,168 @@ This module provides data analysis and statistical functions for scraped data:
 
 from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter, defaultdict
+from enum import Enum
+from itertools import groupby
+from operator import itemgetter
 import json
 import csv
+import math
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Write buffer for CSV exports; keeps syscalls rare on big row counts.
+CSV_BUFFER_SIZE = 1 << 20
+
+
+# Types both encoders write identically; checked by exact type to keep the walk cheap.
+_JSON_PLAIN_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _needs_stdlib_json(value: Any) -> bool:
+    """Return True if orjson would encode a JSON-like structure differently from ``json``.
+
+    That is the case for NaN/Infinity (orjson writes null), plain Enum members
+    (orjson writes their value, ``default=str`` their name) and dict keys the
+    stdlib encoder rejects.
+    """
+    t = type(value)
+    if t in _JSON_PLAIN_TYPES:
+        return False
+    if t is float:
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if type(k) is not str and (k is not None and not isinstance(k, (str, int, float))
+                                       or _needs_stdlib_json(k)):
+                return True
+            if type(v) not in _JSON_PLAIN_TYPES and _needs_stdlib_json(v):
+                return True
+        return False
+    if isinstance(value, (list, tuple)):
+        return any(type(v) not in _JSON_PLAIN_TYPES and _needs_stdlib_json(v) for v in value)
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, Enum):
+        return not isinstance(value, (int, str))
+    return False
+
+
+def _json_default(value: Any) -> Any:
+    """orjson ``default`` hook mirroring what ``json.dump(..., default=str)`` writes."""
+    if isinstance(value, float):  # float subclasses
+        return float(value)
+    if isinstance(value, tuple):  # e.g. namedtuples
+        return list(value)
+    return str(value)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert a JSON-like value into a hashable equivalent.
+
+    Frozen values compare equal exactly when the originals do: hashable values
+    are kept as they are, sets become frozensets, and dicts, lists and unhashable
+    tuples are tagged with their type so that, e.g., ``[1]`` and ``(1,)`` differ.
+    """
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        pass
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(map(_freeze, value)))
+    if isinstance(value, tuple):
+        return (tuple, tuple(map(_freeze, value)))
+    if isinstance(value, set):
+        return frozenset(value)
+    # No hashable form: only the same object counts as a duplicate.
+    return (object, id(value))
+
+
+def _canonical_key(record: Dict[str, Any]) -> Any:
+    """Return a hashable key that compares equal exactly when the records do."""
+    try:
+        return frozenset(record.items())
+    except TypeError:  # nested/unhashable values
+        return frozenset((k, _freeze(v)) for k, v in record.items())
+
+
+def _sum_min_max(values: Any) -> Tuple[float, float, float]:
+    """Compute sum, min and max of a non-empty float64 array in one pass.
+
+    Like NumPy's reductions, min and max are NaN when any value is NaN.
+    """
+    total = 0.0
+    lo = values[0]
+    hi = values[0]
+    for x in values:
+        total += x
+        if x < lo:
+            lo = x
+        elif x > hi:
+            hi = x
+    if total != total:  # a NaN value, or inf + -inf
+        for x in values:
+            if x != x:
+                return total, x, x
+    return total, lo, hi
+
+
+if njit is not None:
+    _sum_min_max = njit(cache=True)(_sum_min_max)
+
+# Below this many values NumPy's reductions are as fast as the Numba kernel,
+# which would only add its JIT compile time to the first call.
+_NUMBA_MIN_SIZE = 1_000_000
+
+
+def _partition_median(values: Any) -> float:
+    """Median of a non-empty float64 array using O(n) selection instead of a sort."""
+    n = values.size
+    k = n // 2
+    if n % 2:
+        return float(np.partition(values, k)[k])
+    part = np.partition(values, (k - 1, k))
+    return float(part[k - 1] + part[k]) / 2
+
 
 class DataAggregator:
     """Aggregate and group scraped data."""
 
     @staticmethod
-    def group_by(data: List[Dict[str, Any]], key: str) -> Dict[str, List[Dict[str, Any]]]:
+    def group_by(data: List[Dict[str, Any]], key: str, sort_keys: bool = False) -> Dict[str, List[Dict[str, Any]]]:
         """
         Group data by a specific key.
 
+        Groups are returned in first-seen order, or in ascending key order when
+        ``sort_keys`` is True (values of ``key`` must then be mutually comparable).
+
         Example:
             data = [{"category": "electronics", "price": 100}, 
                     {"category": "books", "price": 15}]
             grouped = DataAggregator.group_by(data, "category")
             # Returns: {"electronics": [...], "books": [...]}
         """
+        if sort_keys:
+            get_key = itemgetter(key)
+            present = sorted((item for item in data if key in item), key=get_key)
+            return {value: list(group) for value, group in groupby(present, key=get_key)}
+
         grouped = defaultdict(list)
         for item in data:
             if key in item:
@@ -45,7 +188,7 @@ class DataAggregator:
             counts = DataAggregator.count_occurrences(data, "category")
             # Returns frequency of each category
         """
-        values = [item.get(key) for item in data if key in item]
+        values = [item[key] for item in data if key in item]
         return dict(Counter(values))
 
     @staticmethod
@@ -119,6 +262,22 @@ class StatisticalAnalyzer:
         if not values:
             return {}
 
+        if np is not None:
+            arr = np.asarray(values, dtype=np.float64)
+            if njit is not None and arr.size >= _NUMBA_MIN_SIZE:
+                total, lo, hi = _sum_min_max(arr)
+            else:
+                total, lo, hi = arr.sum(), arr.min(), arr.max()
+            return {
+                "count": int(arr.size),
+                "sum": float(total),
+                "average": float(total) / arr.size,
+                # np.partition sorts NaN last; report NaN as np.median does.
+                "median": math.nan if math.isnan(lo) else _partition_median(arr),
+                "min": float(lo),
+                "max": float(hi),
+            }
+
         return {
             "count": len(values),
             "sum": sum(values),
@@ -140,10 +299,8 @@ class DataValidator:
         Returns:
             Tuple of (all_valid, invalid_records)
         """
-        invalid = []
-        for item in data:
-            if not all(field in item for field in required_fields):
-                invalid.append(item)
+        required = frozenset(required_fields)
+        invalid = [item for item in data if not required <= item.keys()]
         return len(invalid) == 0, invalid
 
     @staticmethod
@@ -164,8 +321,16 @@ class DataValidator:
                     unique.append(item)
             return unique
         else:
-            # Remove completely identical records
-            return [dict(t) for t in {tuple(sorted(d.items())) for d in data}]
+            # Remove completely identical records; keys compare like the dicts
+            # themselves, and nested/unhashable values are frozen recursively.
+            seen = set()
+            unique = []
+            for item in data:
+                fingerprint = _canonical_key(item)
+                if fingerprint not in seen:
+                    seen.add(fingerprint)
+                    unique.append(item)
+            return unique
 
 
 class DataExporter:
@@ -180,6 +345,21 @@ class DataExporter:
             DataExporter.to_json(data, "output/results.json")
         """
         Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            # Hand datetimes and dataclasses to the default hook, as json does.
+            option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                      | orjson.OPT_PASSTHROUGH_DATACLASS | (orjson.OPT_INDENT_2 if pretty else 0))
+            payload = None
+            if not _needs_stdlib_json(data):
+                try:
+                    payload = orjson.dumps(data, option=option, default=_json_default)
+                except orjson.JSONEncodeError:
+                    # e.g. integers beyond 64 bits; the stdlib encoder handles them.
+                    pass
+            if payload is not None:
+                with open(file_path, "wb") as f:
+                    f.write(payload)
+                return
         with open(file_path, "w") as f:
             json.dump(data, f, indent=2 if pretty else None, default=str)
 
@@ -195,11 +375,17 @@ class DataExporter:
             return
 
         Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-        keys = data[0].keys()
-        with open(file_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(data)
+        header = data[0].keys()
+        # Like csv.DictWriter, refuse rows with columns the header would drop.
+        for item in data:
+            if not item.keys() <= header:
+                extra = ", ".join(repr(k) for k in item.keys() - header)
+                raise ValueError("dict contains fields not in fieldnames: " + extra)
+        keys = list(header)
+        with open(file_path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            writer.writerows([item.get(k) for k in keys] for item in data)
 
     @staticmethod
     def generate_report(data: List[Dict[str, Any]], stats_field: Optional[str] = None) -> Dict[str, Any]:
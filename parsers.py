@@ -9,17 +9,114 @@ This module provides core web scraping functionality including:
 """
 
 import re
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 
 try:
     from bs4 import BeautifulSoup
+    from bs4.builder import HTMLTreeBuilder
 except ImportError:
     raise ImportError("beautifulsoup4 is required. Install with: pip install beautifulsoup4")
 
+import soupsieve as sv
+
+# BeautifulSoup tree builder: lxml when installed, else the pure-Python parser.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    from lxml import etree
+    from lxml.cssselect import CSSSelector, SelectorError
+except ImportError:
+    CSSSelector = None
+
+_WS_RE = re.compile(r"\s+")
+_PRICE_RE = re.compile(r"\d+(?:\.\d{2})?")
+_ATTR_NAME_RE = re.compile(r"[A-Za-z_][\w.-]*")
+_PSEUDO_RE = re.compile(r"::?([\w-]+)")
+
+# Pseudo-classes cssselect and soupsieve match the same way. Attribute selectors
+# are left to soupsieve, which follows HTML's case-insensitive value matching for
+# attributes such as type=.
+_CSSSELECT_PSEUDOS = frozenset({
+    "first-child", "last-child", "only-child", "nth-child", "nth-last-child",
+    "first-of-type", "last-of-type", "only-of-type", "nth-of-type", "nth-last-of-type",
+    "not",
+})
+
+# Attributes BeautifulSoup returns as lists; the lxml fast path would return strings.
+_LIST_VALUED_ATTRS = frozenset().union(*HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES.values())
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> "sv.SoupSieve":
+    """Compile a CSS selector once and reuse it across calls and pages."""
+    return sv.compile(selector)
+
+
+@lru_cache(maxsize=256)
+def _compile_css_xpath(selector: str) -> Optional["CSSSelector"]:
+    """Translate a CSS selector to a compiled lxml XPath, or None where cssselect may disagree with soupsieve."""
+    if "[" in selector or "\\" in selector:
+        return None
+    if any(name.lower() not in _CSSSELECT_PSEUDOS for name in _PSEUDO_RE.findall(selector)):
+        return None
+    try:
+        return CSSSelector(selector, translator="html")
+    except SelectorError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile_attr_xpath(selector: str, attr: str) -> Optional["etree.XPath"]:
+    """Compile an XPath selecting ``attr`` of every element matching a CSS selector, or None."""
+    if attr in _LIST_VALUED_ATTRS or not _ATTR_NAME_RE.fullmatch(attr):
+        return None
+    compiled = _compile_css_xpath(selector)
+    if compiled is None:
+        return None
+    return etree.XPath(f"({compiled.path})/@{attr}", smart_strings=False)
+
+
+# BeautifulSoup's get_text() leaves out the contents of these elements.
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+def _collect_text(element: Any, parts: List[str]) -> None:
+    if element.text:
+        parts.append(element.text.strip())
+    for child in element:
+        # Comments/PIs have non-str tags: skip their content but keep the tail.
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail.strip())
+
+
+def _lxml_text(element: Any) -> str:
+    """lxml counterpart of BeautifulSoup's ``get_text(strip=True)``."""
+    if not len(element):
+        return (element.text or "").strip()
+    parts: List[str] = []
+    _collect_text(element, parts)
+    return "".join(parts)
+
+
+_UNPARSED = object()
+
 
 class HTMLParser:
-    """Parse and extract data from HTML content using BeautifulSoup."""
+    """
+    Parse and extract data from HTML content using BeautifulSoup (lxml backend when installed).
+
+    Table and attribute extraction may read a separate lxml tree parsed from
+    ``html_content``. Accessing ``soup`` or calling get_all_elements switches
+    those methods back to the soup so that edits are seen.
+    """
 
     def __init__(self, html_content: str, base_url: str = ""):
         """
@@ -31,7 +128,36 @@ class HTMLParser:
         """
         self.html_content = html_content
         self.base_url = base_url
-        self.soup = BeautifulSoup(html_content, "html.parser")
+        self._soup = BeautifulSoup(html_content, HTML_PARSER)
+        self._lxml_doc = _UNPARSED
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """The parsed document; callers may edit it, so the lxml copy is dropped."""
+        self._lxml_doc = None
+        return self._soup
+
+    @soup.setter
+    def soup(self, value: BeautifulSoup) -> None:
+        self._lxml_doc = None
+        self._soup = value
+
+    def _lxml_root(self) -> Any:
+        """
+        Return the document parsed with lxml, parsing it on first use.
+
+        Returns None when lxml/cssselect are not installed, lxml rejects the input,
+        or the soup has been handed out for editing.
+        """
+        if self._lxml_doc is _UNPARSED:
+            doc = None
+            if CSSSelector is not None:
+                try:
+                    doc = etree.HTML(self.html_content)
+                except ValueError:
+                    pass
+            self._lxml_doc = doc
+        return self._lxml_doc
 
     def extract_by_selector(self, selector: str) -> List[str]:
         """
@@ -41,8 +167,8 @@ class HTMLParser:
             # Extract all product names from divs with class 'product-name'
             names = parser.extract_by_selector("div.product-name")
         """
-        elements = self.soup.select(selector)
-        return [elem.get_text(strip=True) for elem in elements]
+        elements = _compile_selector(selector).select(self._soup)
+        return ["".join(elem.stripped_strings) for elem in elements]
 
     def extract_by_selector_attr(self, selector: str, attr: str) -> List[str]:
         """
@@ -52,7 +178,12 @@ class HTMLParser:
             # Extract all product URLs
             urls = parser.extract_by_selector_attr("a.product-link", "href")
         """
-        elements = self.soup.select(selector)
+        root = self._lxml_root()
+        compiled = _compile_attr_xpath(selector, attr) if root is not None else None
+        if compiled is not None:
+            return [value for value in compiled(root) if value]
+
+        elements = _compile_selector(selector).select(self._soup)
         values = []
         for elem in elements:
             value = elem.get(attr)
@@ -60,6 +191,30 @@ class HTMLParser:
                 values.append(value)
         return values
 
+    def batch_extract(self, config: List[Tuple[str, Optional[str]]]) -> Dict[str, List[str]]:
+        """
+        Run several selectors against the already-parsed page.
+
+        Each ``(selector, attr)`` entry collects attribute values like
+        extract_by_selector_attr, or text like extract_by_selector when attr is
+        None. Results are keyed by selector.
+
+        Raises:
+            ValueError: if a selector appears more than once in ``config``
+
+        Example:
+            results = parser.batch_extract([("h2.title", None), ("a.product-link", "href")])
+        """
+        results: Dict[str, List[str]] = {}
+        for selector, attr in config:
+            if selector in results:
+                raise ValueError("duplicate selector in batch_extract config: " + repr(selector))
+            if attr is None:
+                results[selector] = self.extract_by_selector(selector)
+            else:
+                results[selector] = self.extract_by_selector_attr(selector, attr)
+        return results
+
     def extract_table(self, table_selector: str) -> List[Dict[str, str]]:
         """
         Extract table data into list of dictionaries.
@@ -70,7 +225,41 @@ class HTMLParser:
         Returns:
             List of dictionaries where keys are headers and values are cell data
         """
-        table = self.soup.select_one(table_selector)
+        root = self._lxml_root()
+        compiled = _compile_css_xpath(table_selector) if root is not None else None
+        if compiled is None:
+            return self._extract_table_soup(table_selector)
+
+        tables = compiled(root)
+        if not tables:
+            return []
+        table = tables[0]
+
+        rows = list(table.iter("tr"))
+        if not rows:
+            return []
+
+        # Extract headers from thead or first row
+        header_row = table.find(".//thead")
+        if header_row is not None:
+            headers = [_lxml_text(cell) for cell in header_row.iter("th", "td")]
+            rows = [row for row in rows if row.getparent() is not header_row]
+        else:
+            headers = [_lxml_text(cell) for cell in rows[0].iter("th", "td")]
+            rows = rows[1:]
+
+        # Extract data rows
+        data = []
+        for row in rows:
+            cells = list(row.iter("td"))
+            if len(cells) == len(headers):
+                data.append(dict(zip(headers, [_lxml_text(cell) for cell in cells])))
+
+        return data
+
+    def _extract_table_soup(self, table_selector: str) -> List[Dict[str, str]]:
+        """BeautifulSoup implementation of extract_table, used when lxml is unavailable."""
+        table = _compile_selector(table_selector).select_one(self._soup)
         if not table:
             return []
 
@@ -83,6 +272,7 @@ class HTMLParser:
         header_row = table.find("thead")
         if header_row:
             headers = [th.get_text(strip=True) for th in header_row.find_all(["th", "td"])]
+            rows = [row for row in rows if row.parent is not header_row]
         else:
             headers = [td.get_text(strip=True) for td in rows[0].find_all(["th", "td"])]
             rows = rows[1:]
@@ -111,7 +301,9 @@ class HTMLParser:
 
     def get_all_elements(self, selector: str) -> List[Any]:
         """Get all elements matching a CSS selector for advanced manipulation."""
-        return self.soup.select(selector)
+        # Callers may edit these elements, so stop using the lxml copy of the page.
+        self._lxml_doc = None
+        return _compile_selector(selector).select(self._soup)
 
 
 class DataCleaner:
@@ -125,8 +317,7 @@ class DataCleaner:
         if not text:
             return ""
         # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return _WS_RE.sub(" ", text).strip()
 
     @staticmethod
     def clean_price(price_str: str) -> Optional[float]:
@@ -139,13 +330,13 @@ class DataCleaner:
         """
         if not price_str:
             return None
-        match = re.search(r"\d+(?:\.\d{2})?", price_str)
+        match = _PRICE_RE.search(price_str)
         return float(match.group()) if match else None
 
     @staticmethod
     def clean_list(items: List[str]) -> List[str]:
         """Remove empty strings and clean all items in a list."""
-        return [DataCleaner.clean_text(item) for item in items if item]
+        return [_WS_RE.sub(" ", item).strip() for item in items if item]
 
     @staticmethod
     def normalize_whitespace(text: str) -> str:
@@ -153,8 +344,26 @@ class DataCleaner:
         return " ".join(text.split())
 
 
+@lru_cache(maxsize=4096)
+def _is_valid_url(url: str) -> bool:
+    try:
+        result = urlsplit(url)
+        return bool(result.scheme and result.netloc)
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _get_domain(url: str) -> Optional[str]:
+    try:
+        domain = urlsplit(url).netloc.removeprefix("www.")
+        return domain if domain else None
+    except Exception:
+        return None
+
+
 class URLValidator:
-    """Validate and sanitize URLs."""
+    """Validate and sanitize URLs. Results are memoized per URL, since pages repeat hosts heavily."""
 
     @staticmethod
     def is_valid_url(url: str) -> bool:
@@ -165,9 +374,8 @@ class URLValidator:
             True if URL has a valid scheme and netloc
         """
         try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
+            return _is_valid_url(url)
+        except TypeError:  # unhashable input
             return False
 
     @staticmethod
@@ -180,8 +388,6 @@ class URLValidator:
             # Returns: example.com
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.replace("www.", "")
-            return domain if domain else None
-        except Exception:
+            return _get_domain(url)
+        except TypeError:  # unhashable input
             return None
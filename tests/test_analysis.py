@@ -0,0 +1,121 @@
+"""Tests for analysis helpers and the optional accelerated paths."""
+
+import dataclasses
+import datetime
+import enum
+import json
+import math
+from collections import namedtuple
+
+import pytest
+
+import analysis
+from analysis import DataExporter, DataValidator
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+Pair = namedtuple("Pair", "a b")
+
+
+class Price(float):
+    pass
+
+
+@pytest.mark.parametrize("data", [
+    [{"when": datetime.datetime(2024, 1, 2, 3, 4, 5)}, {"day": datetime.date(2024, 1, 2)}],
+    [{"color": Color.RED, "level": Level.LOW}],
+    [{"point": Point(1, 2)}],
+    [{1: "int key", 2.5: "float key", True: "bool key", None: "none key"}],
+    [{"big": 2 ** 70}],
+    [{"nan": float("nan"), "inf": [float("inf")]}],
+    [{"pair": Pair(1, 2), "price": Price(1.5), "tags": {"a"}}],
+    [{"text": "é", "missing": None}],
+])
+def test_to_json_matches_stdlib(tmp_path, monkeypatch, data):
+    pytest.importorskip("orjson")
+    DataExporter.to_json(data, tmp_path / "fast.json")
+    monkeypatch.setattr(analysis, "orjson", None)
+    DataExporter.to_json(data, tmp_path / "stdlib.json")
+    # NaN != NaN, so compare non-finite constants by their spelling.
+    fast = json.loads((tmp_path / "fast.json").read_text(), parse_constant=str)
+    stdlib = json.loads((tmp_path / "stdlib.json").read_text(), parse_constant=str)
+    assert fast == stdlib
+
+
+def test_to_json_rejects_keys_stdlib_rejects(tmp_path):
+    with pytest.raises(TypeError):
+        DataExporter.to_json([{Color.RED: 1}], tmp_path / "out.json")
+
+
+@pytest.mark.filterwarnings("ignore:invalid value:RuntimeWarning")
+@pytest.mark.parametrize("values", [
+    [1, "nan", 3],
+    ["nan", 1, 2, 3],
+    ["inf", "-inf", 2],
+    [5, 1, 4, 2],
+    [7.5],
+])
+def test_get_statistics_numba_kernel_matches_numpy(monkeypatch, values):
+    pytest.importorskip("numba")
+    data = [{"v": v} for v in values]
+    monkeypatch.setattr(analysis, "_NUMBA_MIN_SIZE", 10 ** 9)
+    expected = analysis.StatisticalAnalyzer.get_statistics(data, "v")
+    monkeypatch.setattr(analysis, "_NUMBA_MIN_SIZE", 0)
+    stats = analysis.StatisticalAnalyzer.get_statistics(data, "v")
+    # repr() so that NaN compares equal to NaN.
+    assert {k: repr(v) for k, v in stats.items()} == {k: repr(v) for k, v in expected.items()}
+
+
+def test_get_statistics_median_is_nan_with_nan_values():
+    pytest.importorskip("numpy")
+    stats = analysis.StatisticalAnalyzer.get_statistics([{"v": 1}, {"v": "nan"}, {"v": 3}], "v")
+    assert math.isnan(stats["median"]) and math.isnan(stats["min"]) and math.isnan(stats["max"])
+
+
+@pytest.mark.parametrize("a, b", [
+    ({"x": [1, {"y": [2]}]}, {"x": [1, {"y": [2]}]}),
+    ({"x": {1}}, {"x": frozenset({1})}),
+    ({"x": 1}, {"x": 1.0}),
+    ({"x": [1]}, {"x": [True]}),
+    ({"x": ([1], 2)}, {"x": ([1], 2)}),
+    ({"x": [1], "y": 2}, {"y": 2, "x": [1]}),
+])
+def test_freeze_keeps_equal_values_equal(a, b):
+    assert a == b
+    assert analysis._canonical_key(a) == analysis._canonical_key(b)
+    assert DataValidator.remove_duplicates([a, b]) == [a]
+
+
+@pytest.mark.parametrize("a, b", [
+    ({"x": [1]}, {"x": (1,)}),
+    ({"x": [[1]]}, {"x": [([1],)]}),
+    ({"x": {"y": [1]}}, {"x": {"y": [2]}}),
+    ({"x": [1, 2]}, {"x": [2, 1]}),
+])
+def test_freeze_keeps_unequal_values_apart(a, b):
+    assert a != b
+    assert analysis._canonical_key(a) != analysis._canonical_key(b)
+    assert DataValidator.remove_duplicates([a, b]) == [a, b]
+
+
+class _Unhashable:
+    __hash__ = None
+
+
+def test_freeze_unhashable_objects_match_only_themselves():
+    obj = _Unhashable()
+    records = [{"x": [obj]}, {"x": [obj]}, {"x": [_Unhashable()]}]
+    assert DataValidator.remove_duplicates(records) == records[::2]
@@ -0,0 +1,135 @@
+"""Tests for parsers.HTMLParser's lxml fast paths against the BeautifulSoup paths."""
+
+import pytest
+
+from parsers import HTMLParser
+
+pytest.importorskip("lxml.cssselect")
+
+
+def _table(cell: str) -> str:
+    return f"<table><tr><th>h</th></tr><tr><td>{cell}</td></tr></table>"
+
+
+@pytest.mark.parametrize("cell, expected", [
+    ("<script>s()</script>2", "2"),
+    ("a<template><b>x</b>y</template>z", "az"),
+    ("a<!-- c --> <b> b </b>c<style>.x{}</style>", "abc"),
+    ("  plain  ", "plain"),
+])
+def test_extract_table_text_matches_get_text(cell, expected):
+    parser = HTMLParser(_table(cell))
+    assert parser.extract_table("table") == [{"h": expected}]
+    assert parser._extract_table_soup("table") == [{"h": expected}]
+
+
+TABLES = """
+<table id="t1">
+  <thead><tr><td>Name</td><td>Price</td></tr></thead>
+  <tbody><tr><td>Pen <b>blue</b></td><td>$1.50</td></tr><tr><td>Ink</td></tr></tbody>
+</table>
+<table id="t2">
+  <tr><th>a</th><th> b </th></tr>
+  <tr><td>1</td><td><!-- note -->2</td></tr>
+</table>
+"""
+
+
+@pytest.mark.parametrize("selector", ["#t1", "#t2", "table", "table.missing"])
+def test_extract_table_lxml_matches_soup(selector):
+    parser = HTMLParser(TABLES)
+    assert parser.extract_table(selector) == parser._extract_table_soup(selector)
+
+
+def test_extract_table_skips_thead_rows_of_td_cells():
+    assert HTMLParser(TABLES).extract_table("#t1") == [{"Name": "Penblue", "Price": "$1.50"}]
+
+
+def _soup_only(html: str) -> HTMLParser:
+    parser = HTMLParser(html)
+    parser._lxml_doc = None  # force the BeautifulSoup code paths
+    return parser
+
+
+LINKS = """
+<ul>
+  <li><a class="item hot" rel="nofollow noopener" href="/p/1">one</a></li>
+  <li><a class="item" href="">two</a></li>
+  <li><a class="item" href="https://other.example/p?q=1&amp;r=2">three</a></li>
+  <li><img src="/img.png" data-src="/lazy.png"></li>
+</ul>
+"""
+
+
+@pytest.mark.parametrize("selector, attr", [
+    ("a", "href"),
+    ("a.item, img", "src"),
+    ("img", "data-src"),
+    ("a", "class"),
+    ("a", "rel"),
+    ("li:nth-child(2) a", "href"),
+    ("a", "missing"),
+])
+def test_extract_by_selector_attr_lxml_matches_soup(selector, attr):
+    expected = _soup_only(LINKS).extract_by_selector_attr(selector, attr)
+    assert HTMLParser(LINKS).extract_by_selector_attr(selector, attr) == expected
+
+
+def test_list_valued_attributes_keep_soup_types():
+    assert HTMLParser(LINKS).extract_by_selector_attr("a", "class") == [["item", "hot"], ["item"], ["item"]]
+
+
+def test_attr_extraction_sees_edits_through_get_all_elements():
+    parser = HTMLParser(LINKS)
+    for elem in parser.get_all_elements("a.hot"):
+        elem.decompose()
+    assert parser.extract_by_selector_attr("a", "href") == ["https://other.example/p?q=1&r=2"]
+
+
+FORM = """
+<form>
+  <input TYPE="TEXT" name="q" value="query">
+  <input type="checkbox" name="c" value="on">
+  <p><span id="A" lang="EN-us" data-v="x">t</span></p>
+</form>
+"""
+
+
+@pytest.mark.parametrize("selector, attr", [
+    ("input[type=text]", "name"),
+    ("input[type='checkbox' i]", "value"),
+    ("span[lang|=en]", "data-v"),
+    ("input:checked, p > span:first-child", "name"),
+    ("INPUT:not(:first-child)", "name"),
+    ("span:is(#A)", "lang"),
+])
+def test_selectors_matched_differently_by_cssselect_use_soupsieve(selector, attr):
+    expected = _soup_only(FORM).extract_by_selector_attr(selector, attr)
+    assert HTMLParser(FORM).extract_by_selector_attr(selector, attr) == expected
+
+
+def test_input_type_matches_case_insensitively():
+    assert HTMLParser(FORM).extract_by_selector_attr("input[type=text]", "name") == ["q"]
+
+
+def test_edits_through_soup_property_are_seen():
+    parser = HTMLParser(LINKS)
+    parser.soup.select_one("a.hot").decompose()
+    assert parser.extract_by_selector_attr("a", "href") == ["https://other.example/p?q=1&r=2"]
+    parser = HTMLParser(TABLES)
+    parser.soup.select_one("#t2 td").string = "9"
+    assert parser.extract_table("#t2") == [{"a": "9", "b": "2"}]
+
+
+def test_batch_extract_matches_single_calls():
+    parser = HTMLParser(LINKS)
+    assert parser.batch_extract([("a", None), ("a.item", "href"), ("img", "src")]) == {
+        "a": parser.extract_by_selector("a"),
+        "a.item": parser.extract_by_selector_attr("a.item", "href"),
+        "img": parser.extract_by_selector_attr("img", "src"),
+    }
+
+
+def test_batch_extract_rejects_duplicate_selectors():
+    with pytest.raises(ValueError, match="duplicate selector"):
+        HTMLParser(LINKS).batch_extract([("a", None), ("a", "href")])
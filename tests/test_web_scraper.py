@@ -0,0 +1,100 @@
+"""Tests for web_scraper helpers."""
+
+import time
+from urllib import robotparser
+from urllib.parse import urljoin, urlsplit
+
+import pytest
+
+import web_scraper
+from web_scraper import _NEEDS_URLJOIN_RE, Fetcher, _resolve_link
+
+BASES = [
+    "https://example.com/a/b?q=1#frag",
+    "http://example.com",
+    "https://user:pw@example.com:8080/dir/",
+]
+
+
+@pytest.mark.parametrize("link", [
+    "/a/../b",          # dot segments
+    "/a/./b",
+    "/.",
+    "/a?#",             # empty query before fragment
+    "/a?",
+    "/a#",
+    "/a;params",        # ;params
+    "//[::1]/x",        # IPv6 brackets
+    "//[bad",
+    "/café",       # non-ASCII
+    " /a",              # whitespace / control characters
+    "/a\tb",
+    "/a\\b",            # backslash
+    "//",               # empty host
+    "///x",
+    "https:///x",
+])
+def test_guard_sends_unusual_links_to_urljoin(link):
+    assert not link.isascii() or _NEEDS_URLJOIN_RE.search(link)
+    for base in BASES:
+        try:
+            expected = urljoin(base, link)
+        except ValueError:
+            with pytest.raises(ValueError):
+                _resolve_link(base, urlsplit(base), link)
+        else:
+            assert _resolve_link(base, urlsplit(base), link) == expected
+
+
+@pytest.mark.parametrize("link", [
+    "/products/1",
+    "/search?q=a+b#top",
+    "//cdn.example.net/app.js",
+    "https://other.example/x",
+    "http://other.example",
+    "relative/path",
+    "?page=2",
+    "#section",
+    "",
+])
+def test_fast_path_matches_urljoin(link):
+    for base in BASES:
+        assert _resolve_link(base, urlsplit(base), link) == urljoin(base, link)
+
+
+class _Response:
+    def raise_for_status(self):
+        pass
+
+
+def test_failed_robots_fetch_is_cached_and_fetched_once(monkeypatch):
+    calls = []
+
+    def failing_read(self):
+        calls.append(self.url)
+        time.sleep(0.05)  # let the other workers reach the lock
+        raise OSError("unreachable")
+
+    monkeypatch.setattr(robotparser.RobotFileParser, "read", failing_read)
+    monkeypatch.setattr(web_scraper, "_robots_cache", {})
+    monkeypatch.setattr(web_scraper, "_robots_locks", {})
+    fetcher = Fetcher(base_url="http://robots-fail.test/", concurrency=4)
+    monkeypatch.setattr(fetcher.session, "get", lambda url, timeout: _Response())
+    fetcher.get_many([f"/p/{i}" for i in range(4)])
+    fetcher.get("/p/5")
+    assert calls == ["http://robots-fail.test/robots.txt"]
+
+
+def test_failed_robots_fetch_is_retried_after_the_window(monkeypatch):
+    calls = []
+
+    def failing_read(self):
+        calls.append(self.url)
+        raise OSError("unreachable")
+
+    monkeypatch.setattr(robotparser.RobotFileParser, "read", failing_read)
+    monkeypatch.setattr(web_scraper, "_robots_cache", {})
+    monkeypatch.setattr(web_scraper, "ROBOTS_RETRY_AFTER", 0.0)
+    assert web_scraper._load_robots(("http", "robots-fail.test")) is None
+    assert web_scraper._load_robots(("http", "robots-fail.test")) is None
+    assert len(calls) == 2
@@ -3,8 +3,9 @@ Intermediate Python Web Scraper and Analyzer
 
 Features:
 - Robust HTTP fetching with retries and backoff
+- Concurrent fetching of multiple URLs
 - robots.txt and rate limiting respect
-- HTML parsing with BeautifulSoup4
+- HTML parsing with BeautifulSoup4 (lxml backend when installed)
 - Structured data extraction to CSV/JSON
 - Simple exploratory analysis and summary stats
 - CLI interface and modular design
@@ -13,72 +14,129 @@ Usage:
     python web_scraper.py --url https://example.com --selector "article h2 a" --attr href \
         --out data/links.csv --format csv --concurrency 5
 
-Requirements: see requirements.txt
+Requirements: Python 3.10+; see requirements.txt
 """
 from __future__ import annotations
 
 import argparse
 import csv
 import json
+import math
 import os
 import re
 import sys
+import threading
 import time
-from dataclasses import dataclass, asdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
 
 import requests
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter, Retry
-from urllib.parse import urljoin, urlparse
+from urllib.parse import SplitResult, urljoin, urlsplit
 from urllib import robotparser
 
+from parsers import HTML_PARSER
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 DEFAULT_HEADERS = {
     "User-Agent": "intermediate-python-web-scraper/1.0 (+https://github.com)"
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedItem:
     source_url: str
     text: Optional[str]
     attr: Optional[str]
 
 
+# Column order used when serializing ExtractedItem rows.
+ITEM_FIELDS = ("source_url", "text", "attr")
+
+# Write buffer for CSV output; keeps syscalls rare on big row counts.
+CSV_BUFFER_SIZE = 1 << 20
+
+
+# How long a failed robots.txt fetch is remembered before it is retried.
+ROBOTS_RETRY_AFTER = 300.0
+_ROBOTS_CACHE_SIZE = 128
+# origin -> (parser, or None when the fetch failed; monotonic expiry time)
+_robots_cache: Dict[Tuple[str, str], Tuple[Optional[robotparser.RobotFileParser], float]] = {}
+_robots_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_robots_guard = threading.Lock()
+
+
+def _load_robots(origin: Tuple[str, str]) -> Optional[robotparser.RobotFileParser]:
+    """Fetch and parse robots.txt for a (scheme, netloc) origin, once per process.
+
+    A failed fetch is cached as None for ROBOTS_RETRY_AFTER seconds. A per-origin
+    lock makes concurrent first lookups wait for a single fetch.
+    """
+    entry = _robots_cache.get(origin)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+    with _robots_guard:
+        lock = _robots_locks.setdefault(origin, threading.Lock())
+    with lock:
+        entry = _robots_cache.get(origin)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        scheme, netloc = origin
+        rp = robotparser.RobotFileParser()
+        rp.set_url(f"{scheme}://{netloc}/robots.txt")
+        try:
+            rp.read()
+            entry = (rp, math.inf)
+        except Exception:
+            entry = (None, time.monotonic() + ROBOTS_RETRY_AFTER)
+        with _robots_guard:
+            _robots_cache.pop(origin, None)
+            _robots_cache[origin] = entry
+            while len(_robots_cache) > _ROBOTS_CACHE_SIZE:
+                oldest = next(iter(_robots_cache))
+                del _robots_cache[oldest]
+                _robots_locks.pop(oldest, None)
+    return entry[0]
+
+
 class Fetcher:
     """HTTP client with retries, timeouts, and robots.txt handling."""
 
-    def __init__(self, base_url: Optional[str] = None, timeout: float = 15.0):
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 15.0, concurrency: int = 5):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1: " + str(concurrency))
         self.session = requests.Session()
         retries = Retry(total=5, backoff_factor=0.5,
                         status_forcelist=[429, 500, 502, 503, 504],
                         allowed_methods=["GET", "HEAD"])
         self.session.headers.update(DEFAULT_HEADERS)
-        self.session.mount("http://", HTTPAdapter(max_retries=retries))
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        # Size the connection pool so get_many() workers don't discard connections.
+        self.session.mount("http://", HTTPAdapter(max_retries=retries, pool_maxsize=concurrency))
+        self.session.mount("https://", HTTPAdapter(max_retries=retries, pool_maxsize=concurrency))
         self.timeout = timeout
+        self.concurrency = concurrency
         self.base_url = base_url
-        self._robots = None
-        if base_url:
-            self._init_robots(base_url)
-
-    def _init_robots(self, url: str):
-        parsed = urlparse(url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-        rp = robotparser.RobotFileParser()
-        try:
-            rp.set_url(robots_url)
-            rp.read()
-            self._robots = rp
-        except Exception:
-            self._robots = None
 
     def allowed(self, url: str) -> bool:
-        if not self._robots:
+        # robots.txt is enforced when a base URL is set, against the target's own origin.
+        if not self.base_url:
             return True
-        return self._robots.can_fetch(DEFAULT_HEADERS["User-Agent"], url)
+        parsed = urlsplit(url)
+        robots = _load_robots((parsed.scheme, parsed.netloc))
+        if not robots:
+            return True
+        return robots.can_fetch(DEFAULT_HEADERS["User-Agent"], url)
 
     def get(self, url: str) -> requests.Response:
         if self.base_url:
@@ -89,72 +147,144 @@ class Fetcher:
         resp.raise_for_status()
         return resp
 
+    def get_many(self, urls: Iterable[str], concurrency: Optional[int] = None) -> List[requests.Response]:
+        """Fetch several URLs in parallel threads, returning responses in input order."""
+        if concurrency is None:
+            concurrency = self.concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1: " + str(concurrency))
+        with ThreadPoolExecutor(max_workers=concurrency) as ex:
+            return list(ex.map(self.get, urls))
 
-def extract_items(html: str, base_url: str, selector: str, attr: Optional[str]) -> List[ExtractedItem]:
-    """Parse HTML and extract items by CSS selector.
+
+# Links urljoin would normalize or reject (non-ASCII, whitespace/control chars,
+# backslashes, IPv6 brackets, ;params, dot segments, empty query/fragment
+# markers, empty hosts) must not take the fast path.
+_NEEDS_URLJOIN_RE = re.compile(r"[\x00-\x20\x7f\\\[\];]|/\.|\?#|[?#]$|^(?:https?:)?//(?:[/?#]|$)")
+
+
+def _resolve_link(base_url: str, base: SplitResult, val: str) -> str:
+    """Equivalent of ``urljoin(base_url, val)`` that skips re-parsing for the common link shapes."""
+    if base.scheme in ("http", "https") and base.netloc and val.isascii() and not _NEEDS_URLJOIN_RE.search(val):
+        if val.startswith(("http://", "https://")):
+            return val
+        if val.startswith("//"):
+            return f"{base.scheme}:{val}"
+        if val.startswith("/"):
+            return f"{base.scheme}://{base.netloc}{val}"
+    return urljoin(base_url, val)
+
+
+def iter_items(html: str, base_url: str, selector: str, attr: Optional[str]) -> Iterator[ExtractedItem]:
+    """Parse HTML and lazily yield items by CSS selector.
 
     - If attr is provided, extract attribute value (e.g., href, src). If href/src are relative, resolve to absolute.
     - If attr is None, extract text content.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    results: List[ExtractedItem] = []
+    soup = BeautifulSoup(html, HTML_PARSER)
+    base = urlsplit(base_url)
     for el in soup.select(selector):
         if attr:
             val = el.get(attr)
             if isinstance(val, str) and attr in ("href", "src"):
-                val = urljoin(base_url, val)
-            results.append(ExtractedItem(source_url=base_url, text=None, attr=val))
+                val = _resolve_link(base_url, base, val)
+            yield ExtractedItem(source_url=base_url, text=None, attr=val)
         else:
-            text = el.get_text(strip=True)
-            results.append(ExtractedItem(source_url=base_url, text=text, attr=None))
-    return results
+            text = "".join(el.stripped_strings)
+            yield ExtractedItem(source_url=base_url, text=text, attr=None)
+
+
+def extract_items(html: str, base_url: str, selector: str, attr: Optional[str]) -> List[ExtractedItem]:
+    """Parse HTML and extract items by CSS selector; list-returning form of iter_items."""
+    return list(iter_items(html, base_url, selector, attr))
 
 
 def save_items(items: List[ExtractedItem], out_path: Path, fmt: str = "csv") -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     if fmt == "csv":
-        with out_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["source_url", "text", "attr"]) 
-            writer.writeheader()
-            for it in items:
-                writer.writerow(asdict(it))
+        with out_path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(ITEM_FIELDS)
+            writer.writerows((it.source_url, it.text, it.attr) for it in items)
     elif fmt == "json":
+        rows = [{"source_url": i.source_url, "text": i.text, "attr": i.attr} for i in items]
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(rows, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                payload = None
+            if payload is not None:
+                with out_path.open("wb") as f:
+                    f.write(payload)
+                return
         with out_path.open("w", encoding="utf-8") as f:
-            json.dump([asdict(i) for i in items], f, ensure_ascii=False, indent=2)
+            json.dump(rows, f, ensure_ascii=False, indent=2)
     else:
         raise ValueError("Unsupported format: " + fmt)
 
 
+def stream_items_to_csv(items: Iterable[ExtractedItem], out_path: Path, flush_every: int = 1000) -> int:
+    """Write items to CSV as they are produced, flushing every ``flush_every`` rows.
+
+    Unlike save_items, the full result set is never held in memory, so this pairs
+    with iter_items for large crawls. Returns the number of rows written.
+    """
+    if flush_every < 1:
+        raise ValueError("flush_every must be positive: " + str(flush_every))
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    rows = ((it.source_url, it.text, it.attr) for it in items)
+    count = 0
+    with out_path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(ITEM_FIELDS)
+        while batch := list(islice(rows, flush_every)):
+            writer.writerows(batch)
+            f.flush()
+            count += len(batch)
+    return count
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    try:
+        return urlsplit(url).netloc
+    except Exception:
+        return ""
+
+
 def summarize(items: List[ExtractedItem]) -> Dict[str, Any]:
     """Return simple stats for quick inspection."""
-    n = len(items)
-    n_text = sum(1 for i in items if i.text)
-    n_attr = sum(1 for i in items if i.attr)
-    domains: Dict[str, int] = {}
+    n_text = n_attr = 0
+    domains: Counter = Counter()
     for i in items:
+        n_text += bool(i.text)
+        n_attr += bool(i.attr)
         target = i.attr or i.source_url
-        try:
-            netloc = urlparse(target).netloc
-        except Exception:
-            netloc = ""
-        domains[netloc] = domains.get(netloc, 0) + 1
-    top_domains = sorted(domains.items(), key=lambda x: x[1], reverse=True)[:5]
-    return {"count": n, "text_items": n_text, "attr_items": n_attr, "top_domains": top_domains}
+        # Pages link to few distinct hosts, so _netloc is memoized; non-str
+        # attribute values (e.g. class lists) can't be cached or parsed.
+        domains[_netloc(target) if isinstance(target, str) else ""] += 1
+    return {"count": len(items), "text_items": n_text, "attr_items": n_attr,
+            "top_domains": domains.most_common(5)}
 
 
 def main(argv: Optional[List[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Intermediate Python web scraper and analyzer")
-    p.add_argument("--url", required=True, help="Starting URL to fetch")
+    p.add_argument("--url", required=True, nargs="+", help="URL(s) to fetch")
     p.add_argument("--selector", required=True, help="CSS selector of elements to extract")
     p.add_argument("--attr", default=None, help="Attribute to extract (e.g., href). If omitted, uses text")
     p.add_argument("--out", default="data/output.csv", help="Output file path")
     p.add_argument("--format", choices=["csv", "json"], default="csv", help="Output format")
     p.add_argument("--timeout", type=float, default=15.0, help="Request timeout seconds")
+    p.add_argument("--concurrency", type=int, default=5, help="Maximum parallel requests")
     args = p.parse_args(argv)
+    if args.concurrency < 1:
+        p.error("--concurrency must be at least 1")
 
-    fetcher = Fetcher(base_url=args.url, timeout=args.timeout)
-    resp = fetcher.get(args.url)
-    items = extract_items(resp.text, args.url, args.selector, args.attr)
+    fetcher = Fetcher(base_url=args.url[0], timeout=args.timeout, concurrency=args.concurrency)
+    responses = fetcher.get_many(args.url)
+    # resp.url is the absolute URL after joining and redirects.
+    items = [item for resp in responses
+             for item in extract_items(resp.text, resp.url, args.selector, args.attr)]
     save_items(items, Path(args.out), fmt=args.format)
     stats = summarize(items)
     print(json.dumps(stats, indent=2))